@@ -1,21 +1,36 @@
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Tuple, Literal
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Tuple, Literal, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime, timedelta
+import asyncio
+import threading
 import yfinance as yf
 import pandas as pd
 import numpy as np
 import httpx
+from cachetools import TTLCache
 from enum import Enum
 import os
-from openai import OpenAI
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
+from diskcache import Cache
 
 # Load environment variables from .env file
 load_dotenv()
 
-app = FastAPI(title="PortfoVision API")
+# Persistent on-disk cache so FX rates and finished-day history survive
+# restarts (both are immutable once the trading day is over)
+_DISK_CACHE = None
+try:
+    _DISK_CACHE = Cache(os.getenv("PORTFOVISION_CACHE_DIR", "/tmp/portfovision_cache"))
+except Exception as e:
+    print(f"Disk cache unavailable, continuing without it: {e}")
+
+# orjson serializes the large timeseries payloads several times faster than
+# the stdlib encoder and handles numpy/datetime values natively
+app = FastAPI(title="PortfoVision API", default_response_class=ORJSONResponse)
 
 # CORS middleware - configurable via environment variable
 # Get allowed origins from environment variable, default to localhost for development
@@ -34,10 +49,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shared HTTP client with keep-alive pooling and HTTP/2 so FX lookups reuse
+# connections instead of paying a TCP+TLS handshake per call
+@app.on_event("startup")
+async def startup_event():
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.http.aclose()
+
 # Initialize OpenAI client (optional - will work without API key but won't generate insights)
+# Async client so concurrent per-ticker recommendation calls overlap instead
+# of blocking the event loop one completion at a time
 openai_client = None
 if os.getenv("OPENAI_API_KEY"):
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 # Data models
 class StockHolding(BaseModel):
@@ -104,8 +135,7 @@ class PortfolioRequest(BaseModel):
         weights_sum = sum(self.weights)
         if abs(weights_sum - 1.0) > 0.01:
             raise ValueError(f"Weights must sum to 1.0, but got {weights_sum:.4f}")
-        if self.period not in ["1y", "5y", "10y"]:
-            raise ValueError(f"Period must be '1y', '5y', or '10y', but got {self.period}")
+        # period membership is already enforced by the Literal annotation
         return self
 
 class PortfolioPerformance(BaseModel):
@@ -116,13 +146,18 @@ class PortfolioPerformance(BaseModel):
     class Config:
         populate_by_name = True  # Allow both field name and alias
 
-class PortfolioTimeSeriesPoint(BaseModel):
-    date: str
-    value: float
+class PortfolioTimeSeries(BaseModel):
+    # Columnar layout: two parallel arrays instead of one {date, value} object
+    # per row, which repeated both keys thousands of times on the wire
+    dates: List[str]
+    values: List[float]
 
 class PortfolioResponse(BaseModel):
+    # Documents the /api/portfolio response shape; the endpoint itself builds
+    # a plain dict and serializes through orjson, so no per-point model
+    # construction or validation runs on the hot path
     performance: PortfolioPerformance
-    timeseries: List[PortfolioTimeSeriesPoint]
+    timeseries: PortfolioTimeSeries
     currency: Optional[str] = None
 
 class StockRecommendationRequest(BaseModel):
@@ -148,14 +183,15 @@ INDICES = {
     "DJI": "^DJI"
 }
 
+_PERIOD_DAYS = {
+    "1y": 365,
+    "5y": 365 * 5,
+    "10y": 365 * 10
+}
+
 def get_period_days(period: str) -> int:
     """Convert period string to number of days"""
-    period_map = {
-        "1y": 365,
-        "5y": 365 * 5,
-        "10y": 365 * 10
-    }
-    return period_map.get(period, 365)
+    return _PERIOD_DAYS.get(period, 365)
 
 def normalize_ticker_for_data(ticker: str) -> str:
     """
@@ -184,17 +220,25 @@ def normalize_ticker_for_data(ticker: str) -> str:
     
     return ticker
 
-async def fetch_historical_data(ticker: str, period: str) -> Tuple[pd.DataFrame, str]:
+def fetch_historical_data(ticker: str, period: str) -> Tuple[pd.DataFrame, str]:
     """
-    Fetch historical data for a ticker.
+    Fetch historical data for a ticker (blocking - run via asyncio.to_thread from handlers).
     For TSX stocks without .TO suffix, automatically tries adding .TO if initial fetch fails.
-    
+
     Returns:
     - Tuple of (DataFrame with historical data, actual ticker used)
     """
     normalized_ticker = normalize_ticker_for_data(ticker)
     actual_ticker = normalized_ticker
-    
+
+    # Persisted per calendar day: bars for finished trading days never change,
+    # so after the first fetch a restart doesn't re-download anything
+    cache_key = ("hist", normalized_ticker, period, datetime.now().strftime("%Y-%m-%d"))
+    if _DISK_CACHE is not None:
+        cached = _DISK_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         stock = yf.Ticker(normalized_ticker)
         
@@ -227,53 +271,303 @@ async def fetch_historical_data(ticker: str, period: str) -> Tuple[pd.DataFrame,
         
         if hist.empty:
             raise ValueError(f"No data available for ticker {ticker}")
-        
+
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.set(cache_key, (hist, actual_ticker), expire=86400)
         return hist, actual_ticker
     except ValueError:
         raise
     except Exception as e:
         raise ValueError(f"Error fetching data for {ticker}: {str(e)}")
 
-def calculate_historical_metrics(hist: pd.DataFrame) -> List[HistoricalDataPoint]:
-    """Calculate daily returns and cumulative performance from historical data"""
+# In-process TTL caches so repeat requests for the same ticker/period don't
+# re-hit Yahoo. History is cached for 15 minutes, info (semi-static) for 1 hour.
+_HIST_CACHE = TTLCache(maxsize=1024, ttl=900)   # (ticker, period) -> (hist, actual ticker)
+_INFO_CACHE = TTLCache(maxsize=2048, ttl=3600)  # ticker -> info dict
+_INFLIGHT: dict = {}                            # key -> future of the in-flight upstream fetch
+_CACHE_GUARD = threading.Lock()                 # TTLCache isn't thread-safe; fundamentals run in worker threads
+
+def _cache_get(cache: TTLCache, key):
+    with _CACHE_GUARD:
+        return cache.get(key)
+
+def _cache_put(cache: TTLCache, key, value):
+    with _CACHE_GUARD:
+        cache[key] = value
+
+def get_history_cached_sync(ticker: str, period: str) -> Tuple[pd.DataFrame, str]:
+    """Blocking counterpart of get_history_cached for code already in a worker thread."""
+    key = (ticker, period)
+    cached = _cache_get(_HIST_CACHE, key)
+    if cached is not None:
+        return cached
+    result = fetch_historical_data(ticker, period)
+    _cache_put(_HIST_CACHE, key, result)
+    return result
+
+def get_info_cached_sync(ticker: str) -> dict:
+    """Blocking counterpart of get_info_cached for code already in a worker thread."""
+    cached = _cache_get(_INFO_CACHE, ticker)
+    if cached is not None:
+        return cached
+    info = yf.Ticker(ticker).info
+    _cache_put(_INFO_CACHE, ticker, info)
+    return info
+
+async def _singleflight(key, factory):
+    """
+    Coalesce concurrent cache misses: the first caller for a key runs the
+    factory, later callers arriving before it finishes await the same future
+    instead of launching duplicate upstream fetches. The entry is removed once
+    the flight completes, so the map only ever holds in-progress keys.
+    """
+    fut = _INFLIGHT.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    try:
+        result = await factory()
+        fut.set_result(result)
+        return result
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved in case nobody else is waiting
+        raise
+    finally:
+        _INFLIGHT.pop(key, None)
+
+async def get_history_cached(ticker: str, period: str) -> Tuple[pd.DataFrame, str]:
+    """
+    Cached wrapper around fetch_historical_data. Concurrent misses for the same
+    (ticker, period) coalesce into a single upstream fetch.
+    """
+    cached = _cache_get(_HIST_CACHE, (ticker, period))
+    if cached is not None:
+        return cached
+
+    async def _fetch():
+        return await asyncio.to_thread(get_history_cached_sync, ticker, period)
+
+    return await _singleflight(("hist", ticker, period), _fetch)
+
+async def get_info_cached(ticker: str) -> dict:
+    """Cached wrapper around yf.Ticker().info with the same coalescing as history."""
+    cached = _cache_get(_INFO_CACHE, ticker)
+    if cached is not None:
+        return cached
+
+    async def _fetch():
+        return await asyncio.to_thread(get_info_cached_sync, ticker)
+
+    return await _singleflight(("info", ticker), _fetch)
+
+_CURRENCY_CACHE = TTLCache(maxsize=2048, ttl=3600)  # ticker -> native currency
+_FX_CACHE = TTLCache(maxsize=1024, ttl=3600)        # (from, to, date) -> rate
+
+def fetch_stock_currency(stock: yf.Ticker) -> str:
+    """
+    Read a ticker's native currency (blocking).
+
+    Uses fast_info, which is a small price-summary fetch, instead of the full
+    .info scrape - the portfolio endpoints only need the currency field and the
+    full scrape costs seconds per ticker.
+    """
+    try:
+        currency = stock.fast_info["currency"]
+        if currency:
+            return currency
+    except Exception:
+        pass
+    try:
+        return stock.info.get("currency", "USD")
+    except Exception:
+        return "USD"
+
+async def get_stock_currency(ticker: str) -> str:
+    """Cached async wrapper around fetch_stock_currency."""
+    if ticker in _CURRENCY_CACHE:
+        return _CURRENCY_CACHE[ticker]
+    currency = await asyncio.to_thread(lambda: fetch_stock_currency(yf.Ticker(ticker)))
+    _CURRENCY_CACHE[ticker] = currency
+    return currency
+
+def download_history_batch(tickers: List[str], period: str) -> dict:
+    """
+    Download history for many tickers in a single batched yfinance request
+    (blocking - run via asyncio.to_thread from handlers).
+
+    yf.download batches symbols into one request and threads internally, so this
+    replaces N per-ticker HTTP round-trips with one. Tickers that come back
+    empty (typically TSX stocks given without a suffix) are retried once as a
+    second batched download with the .TO suffix.
+
+    Returns:
+    - Dict mapping the normalized input ticker to (DataFrame, actual ticker used)
+    """
+    normalized = list(dict.fromkeys(normalize_ticker_for_data(t) for t in tickers))
+
+    def _extract(data: pd.DataFrame, ticker: str, n_tickers: int) -> Optional[pd.DataFrame]:
+        if data is None or data.empty:
+            return None
+        # With a single ticker yf.download returns flat columns; with several,
+        # group_by='ticker' gives a (ticker, field) MultiIndex
+        if n_tickers == 1 and not isinstance(data.columns, pd.MultiIndex):
+            hist = data
+        elif isinstance(data.columns, pd.MultiIndex) and ticker in data.columns.get_level_values(0):
+            hist = data[ticker]
+        else:
+            return None
+        hist = hist.dropna(how="all")
+        return hist if not hist.empty else None
+
+    def _download(symbols: List[str]) -> pd.DataFrame:
+        return yf.download(
+            tickers=" ".join(symbols),
+            period=period,
+            auto_adjust=False,
+            group_by='ticker',
+            threads=True,
+            progress=False
+        )
+
+    results = {}
+    failed = []
+    data = _download(normalized)
+    for ticker in normalized:
+        hist = _extract(data, ticker, len(normalized))
+        if hist is not None:
+            results[ticker] = (hist, ticker)
+        else:
+            failed.append(ticker)
+
+    # Retry failed non-index tickers as TSX symbols, mirroring the .TO fallback
+    # in fetch_historical_data
+    retry = [t for t in failed if not t.startswith("^") and ".TO" not in t]
+    if retry:
+        retry_symbols = [f"{t}.TO" for t in retry]
+        retry_data = _download(retry_symbols)
+        for ticker, tsx_ticker in zip(retry, retry_symbols):
+            hist = _extract(retry_data, tsx_ticker, len(retry_symbols))
+            if hist is not None:
+                results[ticker] = (hist, tsx_ticker)
+
+    # Last resort: per-ticker fetch for anything still missing, which also
+    # applies the explicit start/end-date retry that yf.download lacks
+    for ticker in failed:
+        if ticker in results:
+            continue
+        try:
+            results[ticker] = fetch_historical_data(ticker, period)
+        except Exception:
+            continue
+
+    return results
+
+async def download_history_batch_cached(tickers: List[str], period: str) -> dict:
+    """
+    Cache-aware wrapper around download_history_batch: serves tickers already in
+    the history cache and only downloads the rest, feeding results back in.
+    """
+    results = {}
+    missing = []
+    for ticker in tickers:
+        normalized = normalize_ticker_for_data(ticker)
+        cached = _cache_get(_HIST_CACHE, (normalized, period))
+        if cached is not None:
+            results[normalized] = cached
+        else:
+            missing.append(ticker)
+
+    if missing:
+        fetched = await asyncio.to_thread(download_history_batch, missing, period)
+        for normalized, entry in fetched.items():
+            _cache_put(_HIST_CACHE, (normalized, period), entry)
+            results[normalized] = entry
+
+    return results
+
+def calculate_historical_rows(hist: pd.DataFrame, prices: Optional[pd.Series] = None) -> List[dict]:
+    """
+    Calculate daily returns and cumulative performance as plain dicts.
+
+    An already-transformed price series (e.g. currency-converted) can be passed
+    via `prices`; otherwise Adjusted Close is used, falling back to Close.
+    """
     if hist.empty:
         return []
-    
-    # Use Adjusted Close if available, otherwise use Close
-    if 'Adj Close' in hist.columns:
-        prices = hist['Adj Close']
-    else:
-        prices = hist['Close']
-    
-    # Calculate daily returns as percentage
-    daily_returns = prices.pct_change() * 100
-    
-    # Calculate cumulative performance as percentage
-    # Starting from first non-null value
-    first_price = prices.iloc[0]
-    cumulative_performance = ((prices / first_price) - 1) * 100
-    
-    # Prepare data points
-    data_points = []
-    for date, row in hist.iterrows():
-        idx = hist.index.get_loc(date)
-        data_points.append(HistoricalDataPoint(
-            date=date.strftime("%Y-%m-%d"),
-            adjusted_close=float(prices.iloc[idx]),
-            daily_return=float(daily_returns.iloc[idx]) if not pd.isna(daily_returns.iloc[idx]) else 0.0,
-            cumulative_performance=float(cumulative_performance.iloc[idx])
-        ))
-    
-    return data_points
+
+    if prices is None:
+        # Use Adjusted Close if available, otherwise use Close
+        if 'Adj Close' in hist.columns:
+            prices = hist['Adj Close']
+        else:
+            prices = hist['Close']
+
+    # Compute everything as numpy arrays in one vectorized pass instead of
+    # iterating rows (iterrows + get_loc is pure Python overhead per point)
+    prices_arr = prices.to_numpy(dtype=np.float64)
+    daily_returns = np.nan_to_num(prices.pct_change().to_numpy(dtype=np.float64) * 100, nan=0.0)
+    cumulative_performance = (prices_arr / prices_arr[0] - 1) * 100
+    dates = hist.index.strftime("%Y-%m-%d")
+
+    return [
+        {
+            "date": d,
+            "adjusted_close": float(p),
+            "daily_return": float(r),
+            "cumulative_performance": float(c)
+        }
+        for d, p, r, c in zip(dates, prices_arr, daily_returns, cumulative_performance)
+    ]
+
+def calculate_historical_metrics(hist: pd.DataFrame, prices: Optional[pd.Series] = None) -> List[HistoricalDataPoint]:
+    """Calculate daily returns and cumulative performance from historical data"""
+    # Values are computed internally and already the right types, so skip
+    # pydantic validation with model_construct (it runs per point otherwise)
+    return [HistoricalDataPoint.model_construct(**row) for row in calculate_historical_rows(hist, prices)]
 
 async def get_fx_rate(from_currency: str, to_currency: str, date: Optional[datetime] = None) -> float:
     """
     Get FX rate using exchangerate.host API.
     Supports historical rates if date is provided, otherwise returns current rate.
+
+    Fetched rates are cached on disk - historical rates for a day (they never
+    change), the latest rate for an hour.
     """
     if from_currency == to_currency:
         return 1.0
-    
+
+    cache_key = ("fx", from_currency, to_currency,
+                 date.strftime("%Y-%m-%d") if date else "latest")
+
+    # In-memory memo first (no disk roundtrip), then the persistent cache
+    cached = _cache_get(_FX_CACHE, cache_key)
+    if cached is not None:
+        return cached
+    if _DISK_CACHE is not None:
+        cached = _DISK_CACHE.get(cache_key)
+        if cached is not None:
+            _cache_put(_FX_CACHE, cache_key, cached)
+            return cached
+
+    rate = await _fetch_fx_rate(from_currency, to_currency, date)
+    if rate is not None:
+        _cache_put(_FX_CACHE, cache_key, rate)
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.set(cache_key, rate, expire=86400 if date else 3600)
+        return rate
+
+    # Final fallback rate (approximate current rates)
+    if from_currency == "USD" and to_currency == "CAD":
+        return 1.35
+    elif from_currency == "CAD" and to_currency == "USD":
+        return 0.74
+    return 1.0
+
+async def _fetch_fx_rate(from_currency: str, to_currency: str, date: Optional[datetime] = None) -> Optional[float]:
+    """Fetch an FX rate from exchangerate.host, falling back to yfinance. Returns None on failure."""
     try:
         # Use exchangerate.host API for live rates (free, no API key required)
         base_url = "https://api.exchangerate.host"
@@ -286,20 +580,26 @@ async def get_fx_rate(from_currency: str, to_currency: str, date: Optional[datet
             # Current rate
             url = f"{base_url}/latest?base={from_currency}&symbols={to_currency}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
-            if response.status_code == 200:
-                data = response.json()
-                # exchangerate.host API structure: { "success": true, "rates": { "CAD": 1.35 } }
-                if data.get("success") and "rates" in data:
-                    rate = data["rates"].get(to_currency)
-                    if rate:
-                        return float(rate)
-                # Fallback: try direct access to rates
-                elif "rates" in data:
-                    rate = data["rates"].get(to_currency)
-                    if rate:
-                        return float(rate)
+        client = getattr(app.state, "http", None)
+        if client is not None:
+            response = await client.get(url)
+        else:
+            # Not inside the app lifecycle (e.g. scripts/tests) - one-off client
+            async with httpx.AsyncClient() as one_off:
+                response = await one_off.get(url, timeout=10.0)
+
+        if response.status_code == 200:
+            data = response.json()
+            # exchangerate.host API structure: { "success": true, "rates": { "CAD": 1.35 } }
+            if data.get("success") and "rates" in data:
+                rate = data["rates"].get(to_currency)
+                if rate:
+                    return float(rate)
+            # Fallback: try direct access to rates
+            elif "rates" in data:
+                rate = data["rates"].get(to_currency)
+                if rate:
+                    return float(rate)
     except Exception as e:
         print(f"Error fetching FX rate from exchangerate.host: {e}")
         # Fallback to yfinance
@@ -320,13 +620,8 @@ async def get_fx_rate(from_currency: str, to_currency: str, date: Optional[datet
                     return 1.0 / float(rate)
         except Exception as e2:
             print(f"Error fetching FX rate from yfinance: {e2}")
-    
-    # Final fallback rate (approximate current rates)
-    if from_currency == "USD" and to_currency == "CAD":
-        return 1.35
-    elif from_currency == "CAD" and to_currency == "USD":
-        return 0.74
-    return 1.0
+
+    return None
 
 def normalize_ticker(ticker: str, exchange: str = "NYSE") -> str:
     """Normalize ticker symbol based on exchange"""
@@ -343,6 +638,92 @@ def normalize_ticker(ticker: str, exchange: str = "NYSE") -> str:
     
     return ticker
 
+def _pad_fill(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Forward- then backward-fill NaNs, equivalent to df.ffill().bfill() but
+    done with numpy index maps on one working array instead of allocating two
+    intermediate DataFrames over the full price matrix.
+    """
+    arr = df.to_numpy(dtype=np.float64, copy=True)
+    if arr.size == 0:
+        return df
+    cols = np.arange(arr.shape[1])
+    rows = np.arange(arr.shape[0])[:, None]
+
+    # Forward fill: each NaN takes the value at the last non-NaN row above it
+    mask = np.isnan(arr)
+    idx = np.where(~mask, rows, 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    arr = arr[idx, cols]
+
+    # Backward fill the leading NaNs that had no prior value
+    mask = np.isnan(arr)
+    if mask.any():
+        idx = np.where(~mask, rows, arr.shape[0] - 1)
+        idx = np.minimum.accumulate(idx[::-1], axis=0)[::-1]
+        arr = arr[idx, cols]
+
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
+
+# Annualization factors (252 trading days per year), computed once at import
+# instead of a fresh np.sqrt scalar per metrics call
+_SQRT252 = float(np.sqrt(252.0))
+_ANNUALIZE_PCT = _SQRT252 * 100.0
+
+def _max_drawdown_pct(values: np.ndarray) -> float:
+    """Maximum drawdown in percent of a value/price array, in one numpy pass."""
+    peaks = np.maximum.accumulate(values)
+    return float(((values - peaks) / peaks).min() * 100)
+
+def _portfolio_stats(pv: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Fused stats kernel over a portfolio value array.
+
+    Returns (cumulative return, annualized volatility, max drawdown), all in
+    percent, from one pass over the log returns and one over the running peak,
+    with no intermediate pandas objects.
+    """
+    log_returns = np.diff(np.log(pv))
+
+    cumulative_return = (pv[-1] / pv[0] - 1.0) * 100
+
+    # 252 trading days per year; ddof=1 matches pandas .std()
+    annualized_volatility = log_returns.std(ddof=1) * _ANNUALIZE_PCT
+
+    return (float(cumulative_return), float(annualized_volatility),
+            _max_drawdown_pct(pv))
+
+def _metrics_core(returns: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Fused metrics kernel over a raw returns array.
+
+    Works directly on numpy arrays so the per-ticker metric computation avoids
+    the pandas Series allocations (cumprod/cummax/std each building a new
+    indexed Series) that dominated the old implementation.
+    """
+    # Cumulative returns
+    cumulative = np.cumprod(1.0 + returns)
+
+    # Total return
+    total_return = cumulative[-1] - 1.0
+
+    # Annualized return (252 trading days per year)
+    years = returns.size / 252
+    annualized_return = cumulative[-1] ** (1 / years) - 1 if years > 0 else 0.0
+
+    # Volatility (annualized; ddof=1 matches pandas .std())
+    volatility = returns.std(ddof=1) * _SQRT252
+
+    # Maximum drawdown
+    running_max = np.maximum.accumulate(cumulative)
+    max_drawdown = ((cumulative - running_max) / running_max).min()
+
+    # Sharpe ratio (assuming risk-free rate of 0)
+    sharpe_ratio = annualized_return / volatility if volatility > 0 else 0.0
+
+    return (float(total_return), float(annualized_return), float(volatility),
+            float(max_drawdown), float(sharpe_ratio))
+
 def calculate_metrics(returns: pd.Series) -> PerformanceMetrics:
     """Calculate performance metrics from returns"""
     if returns.empty:
@@ -353,35 +734,16 @@ def calculate_metrics(returns: pd.Series) -> PerformanceMetrics:
             max_drawdown=0.0,
             sharpe_ratio=0.0
         )
-    
-    # Cumulative returns
-    cumulative = (1 + returns).cumprod()
-    
-    # Total return
-    total_return = cumulative.iloc[-1] - 1
-    
-    # Annualized return
-    days = len(returns)
-    years = days / 252  # Trading days per year
-    annualized_return = (cumulative.iloc[-1] ** (1/years)) - 1 if years > 0 else 0
-    
-    # Volatility (annualized)
-    volatility = returns.std() * np.sqrt(252)
-    
-    # Maximum drawdown
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
-    max_drawdown = drawdown.min()
-    
-    # Sharpe ratio (assuming risk-free rate of 0)
-    sharpe_ratio = (annualized_return / volatility) if volatility > 0 else 0
-    
+
+    total_return, annualized_return, volatility, max_drawdown, sharpe_ratio = \
+        _metrics_core(returns.to_numpy(dtype=np.float64))
+
     return PerformanceMetrics(
-        total_return=float(total_return),
-        annualized_return=float(annualized_return),
-        volatility=float(volatility),
-        max_drawdown=float(max_drawdown),
-        sharpe_ratio=float(sharpe_ratio)
+        total_return=total_return,
+        annualized_return=annualized_return,
+        volatility=volatility,
+        max_drawdown=max_drawdown,
+        sharpe_ratio=sharpe_ratio
     )
 
 @app.get("/")
@@ -397,10 +759,7 @@ async def calculate_portfolio(portfolio: Portfolio, years: int = 1):
         
         end_date = datetime.now()
         start_date = end_date - timedelta(days=years * 365 + 30)
-        
-        # Get FX rate for currency conversion
-        fx_rate = await get_fx_rate("USD", portfolio.currency)
-        
+
         # Normalize weights to sum to 100
         total_weight = sum(h.weight for h in portfolio.holdings)
         if total_weight == 0:
@@ -408,88 +767,116 @@ async def calculate_portfolio(portfolio: Portfolio, years: int = 1):
         
         normalized_weights = {normalize_ticker(h.ticker): (h.weight / total_weight) * 100 for h in portfolio.holdings}
         
-        # Fetch data for all holdings
-        portfolio_data = {}
-        stock_currencies = {}
-        
-        for holding in portfolio.holdings:
-            ticker = normalize_ticker(holding.ticker)
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(start=start_date, end=end_date)
-                
-                if not hist.empty:
-                    # Get stock currency
-                    info = stock.info
-                    stock_currency = info.get("currency", "USD")
-                    stock_currencies[ticker] = stock_currency
-                    
-                    # Convert to portfolio currency if needed
-                    if stock_currency != portfolio.currency:
-                        if stock_currency == "USD" and portfolio.currency == "CAD":
-                            # USD to CAD
-                            conversion_rate = await get_fx_rate("USD", "CAD")
-                            hist['Close'] = hist['Close'] * conversion_rate
-                        elif stock_currency == "CAD" and portfolio.currency == "USD":
-                            # CAD to USD
-                            conversion_rate = await get_fx_rate("CAD", "USD")
-                            hist['Close'] = hist['Close'] * conversion_rate
-                    
-                    portfolio_data[ticker] = hist['Close']
-            except Exception as e:
-                print(f"Error fetching {ticker}: {e}")
-                continue
-        
-        if not portfolio_data:
+        # Fetch all holdings in one batched yfinance download. group_by='ticker'
+        # returns a date-aligned MultiIndex frame, so slicing out the Adj Close
+        # level (dividend/split-adjusted, like the per-ticker history() default)
+        # gives the portfolio price matrix directly - no dict-of-Series
+        # intermediate and no pairwise index realignment in pd.DataFrame()
+        tickers = list(dict.fromkeys(normalize_ticker(h.ticker) for h in portfolio.holdings))
+
+        def _download_holdings() -> pd.DataFrame:
+            return yf.download(
+                tickers=" ".join(tickers),
+                start=start_date,
+                end=end_date,
+                auto_adjust=False,
+                group_by='ticker',
+                threads=True,
+                progress=False
+            )
+
+        data = await asyncio.to_thread(_download_holdings)
+        if data is None or data.empty:
             return {"error": "No valid stock data found"}
-        
-        # Combine into portfolio DataFrame, aligning dates
-        df = pd.DataFrame(portfolio_data)
+
+        if isinstance(data.columns, pd.MultiIndex):
+            df = data.xs('Adj Close', level=1, axis=1)
+        else:
+            # Single ticker: yf.download returns flat columns
+            df = data[['Adj Close']].rename(columns={'Adj Close': tickers[0]})
+        df = df.dropna(axis=1, how='all')
+
+        if df.empty or df.shape[1] == 0:
+            return {"error": "No valid stock data found"}
+
+        # Look up each holding's native currency concurrently
+        currency_results = await asyncio.gather(
+            *[get_stock_currency(t) for t in df.columns],
+            return_exceptions=True
+        )
+        stock_currencies = {t: (c if not isinstance(c, Exception) else "USD")
+                            for t, c in zip(df.columns, currency_results)}
+
+        # One FX lookup per distinct currency pair instead of one per holding
+        needed_pairs = {(c, portfolio.currency) for c in stock_currencies.values()
+                        if c != portfolio.currency}
+        pair_rates = dict(zip(
+            needed_pairs,
+            await asyncio.gather(*[get_fx_rate(a, b) for a, b in needed_pairs])
+        ))
+
+        # Convert to portfolio currency where needed (column-wise scalar scale)
+        for ticker, stock_currency in stock_currencies.items():
+            if stock_currency != portfolio.currency:
+                conversion_rate = pair_rates.get((stock_currency, portfolio.currency))
+                if conversion_rate is not None:
+                    df[ticker] = df[ticker] * conversion_rate
+
         # Forward fill then backward fill to handle missing dates
-        df = df.ffill().bfill()
+        df = _pad_fill(df)
         
         if df.empty:
             return {"error": "No overlapping trading dates found"}
         
-        # Normalize each stock to start at 1.0 (base 100)
-        df_normalized = df / df.iloc[0]
-        
-        # Calculate weighted portfolio (weights are in percentages, so divide by 100)
-        portfolio_values = pd.Series(0.0, index=df_normalized.index)
-        
-        for ticker, price_series in df_normalized.items():
-            if ticker in normalized_weights:
-                weight = normalized_weights[ticker] / 100.0  # Convert percentage to decimal
-                portfolio_values += price_series * weight
-        
+        # Normalize each stock to start at 1.0 (base 100). float32 halves the
+        # bytes touched by the memory-bound passes below; normalized values sit
+        # near 1.0 so the precision loss is far below display resolution, and
+        # final metrics are promoted back to float64 at the boundary
+        df_normalized = (df / df.iloc[0]).astype(np.float32)
+
+        # Calculate weighted portfolio as one matrix-vector product instead of
+        # accumulating per-ticker Series (weights are in percentages, so divide by 100)
+        weight_vector = np.array(
+            [normalized_weights.get(t, 0.0) / 100.0 for t in df_normalized.columns],
+            dtype=np.float32
+        )
+        portfolio_values = pd.Series(df_normalized.to_numpy() @ weight_vector,
+                                     index=df_normalized.index)
+
         # Calculate returns
         returns = portfolio_values.pct_change().dropna()
         
         # Calculate metrics
         metrics = calculate_metrics(returns)
         
-        # Prepare chart data
-        chart_data = []
-        for date, value in portfolio_values.items():
-            chart_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "value": float(value),
-                "portfolio": float(value)
-            })
+        # Prepare chart data (dates formatted in one batched strftime call)
+        chart_data = [
+            {"date": d, "value": float(v), "portfolio": float(v)}
+            for d, v in zip(portfolio_values.index.strftime("%Y-%m-%d"),
+                            portfolio_values.to_numpy())
+        ]
         
-        # Get individual stock returns
-        individual_returns = {}
-        for ticker, price_series in df_normalized.items():
-            if ticker in normalized_weights:
-                stock_returns = price_series.pct_change().dropna()
-                stock_metrics = calculate_metrics(stock_returns)
-                individual_returns[ticker] = {
-                    "total_return": stock_metrics.total_return,
-                    "annualized_return": stock_metrics.annualized_return,
-                    "volatility": stock_metrics.volatility,
-                    "max_drawdown": stock_metrics.max_drawdown,
-                    "weight": normalized_weights[ticker]
-                }
+        # Get individual stock metrics in one set of frame-wide passes instead
+        # of running the full metrics kernel once per column
+        df_returns = df_normalized.pct_change().iloc[1:]
+        df_cum = (1 + df_returns).cumprod()
+        total_returns = df_cum.iloc[-1] - 1
+        years = len(df_returns) / 252
+        annualized_returns = (df_cum.iloc[-1] ** (1 / years) - 1) if years > 0 else total_returns * 0.0
+        volatilities = df_returns.std() * _SQRT252
+        running_max_cum = df_cum.cummax()
+        max_drawdowns = ((df_cum - running_max_cum) / running_max_cum).min()
+
+        individual_returns = {
+            ticker: {
+                "total_return": float(total_returns[ticker]),
+                "annualized_return": float(annualized_returns[ticker]),
+                "volatility": float(volatilities[ticker]),
+                "max_drawdown": float(max_drawdowns[ticker]),
+                "weight": normalized_weights[ticker]
+            }
+            for ticker in df_normalized.columns if ticker in normalized_weights
+        }
         
         return {
             "metrics": metrics.dict(),
@@ -538,13 +925,12 @@ async def get_index_data(index_name: str, years: int = 1, currency: Optional[str
         returns = normalized.pct_change().dropna()
         metrics = calculate_metrics(returns)
         
-        # Prepare chart data
-        chart_data = []
-        for date, value in normalized.items():
-            chart_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "value": float(value)
-            })
+        # Prepare chart data (dates formatted in one batched strftime call)
+        chart_data = [
+            {"date": d, "value": float(v)}
+            for d, v in zip(normalized.index.strftime("%Y-%m-%d"),
+                            normalized.to_numpy())
+        ]
         
         return {
             "metrics": metrics.dict(),
@@ -556,28 +942,45 @@ async def get_index_data(index_name: str, years: int = 1, currency: Optional[str
     except Exception as e:
         return {"error": str(e)}
 
+# Whole-response cache for the small, semi-static lookup endpoints (FX rates
+# update hourly at best; exchange/name/currency info is effectively static)
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=3600)
+
 @app.get("/api/stock/{ticker}")
 async def get_stock_info(ticker: str):
-    """Get stock information"""
+    """Get stock information (response cached for an hour)"""
     try:
         normalized_ticker = normalize_ticker(ticker)
-        stock = yf.Ticker(normalized_ticker)
-        info = stock.info
-        
-        return {
+        cache_key = ("stock", normalized_ticker)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        info = await get_info_cached(normalized_ticker)
+
+        payload = {
             "ticker": normalized_ticker,
             "name": info.get("longName", ticker),
             "exchange": info.get("exchange", "Unknown"),
             "currency": info.get("currency", "USD")
         }
+        _RESPONSE_CACHE[cache_key] = payload
+        return payload
     except Exception as e:
         return {"error": str(e)}
 
 @app.get("/api/fx-rate")
 async def get_fx_rate_api(from_currency: str = "USD", to_currency: str = "CAD"):
-    """Get FX rate"""
+    """Get FX rate (response cached for an hour)"""
+    cache_key = ("fx-rate", from_currency, to_currency)
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     rate = await get_fx_rate(from_currency, to_currency)
-    return {"from": from_currency, "to": to_currency, "rate": rate}
+    payload = {"from": from_currency, "to": to_currency, "rate": rate}
+    _RESPONSE_CACHE[cache_key] = payload
+    return payload
 
 @app.get("/api/data", response_model=HistoricalDataResponse)
 async def get_historical_data(
@@ -611,50 +1014,43 @@ async def get_historical_data(
         if period_str not in ["1y", "5y", "10y"]:
             raise HTTPException(status_code=400, detail="Period must be 1y, 5y, or 10y")
         
-        # Fetch historical data
-        hist, actual_ticker = await fetch_historical_data(ticker, period_str)
-        
+        # Fetch historical data (cached; blocking yfinance call runs in a worker thread)
+        hist, actual_ticker = await get_history_cached(ticker, period_str)
+
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No data available for ticker {ticker}")
-        
+
         # Get stock info to determine native currency
-        stock = yf.Ticker(actual_ticker)
-        info = stock.info
+        info = await get_info_cached(actual_ticker)
         stock_currency = info.get("currency", "USD")
         target_currency = currency or stock_currency
-        
-        # Convert to target currency if specified and different from stock currency
+
+        # Use Adjusted Close if available, otherwise use Close
+        if 'Adj Close' in hist.columns:
+            prices = hist['Adj Close']
+        else:
+            prices = hist['Close']
+
+        # Convert to target currency if specified and different from stock currency.
+        # The scalar multiply allocates a fresh series, so the cached frame is
+        # never copied or mutated.
         if target_currency and target_currency != stock_currency and target_currency in ["USD", "CAD"]:
-            if 'Adj Close' in hist.columns:
-                prices_to_convert = hist['Adj Close'].copy()
-            else:
-                prices_to_convert = hist['Close'].copy()
-            
             # Get FX rate for conversion (use first date's rate for consistency)
-            first_date = prices_to_convert.index[0] if isinstance(prices_to_convert.index, pd.DatetimeIndex) else None
+            first_date = prices.index[0] if isinstance(prices.index, pd.DatetimeIndex) else None
             if stock_currency == "USD" and target_currency == "CAD":
                 fx_rate = await get_fx_rate("USD", "CAD", first_date)
-                if 'Adj Close' in hist.columns:
-                    hist['Adj Close'] = hist['Adj Close'] * fx_rate
-                hist['Close'] = hist['Close'] * fx_rate
+                prices = prices * fx_rate
             elif stock_currency == "CAD" and target_currency == "USD":
                 fx_rate = await get_fx_rate("CAD", "USD", first_date)
-                if 'Adj Close' in hist.columns:
-                    hist['Adj Close'] = hist['Adj Close'] * fx_rate
-                hist['Close'] = hist['Close'] * fx_rate
-        
+                prices = prices * fx_rate
+
         # Calculate metrics
-        data_points = calculate_historical_metrics(hist)
-        
+        data_points = calculate_historical_metrics(hist, prices=prices)
+
         if not data_points:
             raise HTTPException(status_code=404, detail=f"Unable to process data for ticker {ticker}")
-        
+
         # Calculate summary statistics
-        if 'Adj Close' in hist.columns:
-            prices = hist['Adj Close']
-        else:
-            prices = hist['Close']
-        
         daily_returns = prices.pct_change().dropna() * 100
         total_return = ((prices.iloc[-1] / prices.iloc[0]) - 1) * 100
         
@@ -710,20 +1106,35 @@ async def get_historical_data_batch(
         period_str = period.value if isinstance(period, Period) else period
         results = {}
         errors = {}
-        
-        for ticker in ticker_list:
-            try:
-                hist, actual_ticker = await fetch_historical_data(ticker, period_str)
-                data_points = calculate_historical_metrics(hist)
-                
-                results[actual_ticker] = {
-                    "ticker": actual_ticker,
-                    "period": period_str,
-                    "data": [dp.dict() for dp in data_points],
-                    "data_points": len(data_points)
-                }
-            except Exception as e:
-                errors[ticker] = str(e)
+
+        batch = await download_history_batch_cached(ticker_list, period_str)
+
+        # Metric computation is CPU-bound pandas/numpy work - run the per-ticker
+        # passes concurrently in worker threads instead of serially
+        async def _process_one(ticker: str) -> Tuple[str, List[dict]]:
+            normalized = normalize_ticker_for_data(ticker)
+            if normalized not in batch:
+                raise ValueError(f"No data available for ticker {ticker}")
+            hist, actual_ticker = batch[normalized]
+            rows = await asyncio.to_thread(calculate_historical_rows, hist)
+            return actual_ticker, rows
+
+        outcomes = await asyncio.gather(
+            *[_process_one(t) for t in ticker_list],
+            return_exceptions=True
+        )
+
+        for ticker, outcome in zip(ticker_list, outcomes):
+            if isinstance(outcome, Exception):
+                errors[ticker] = str(outcome)
+                continue
+            actual_ticker, rows = outcome
+            results[actual_ticker] = {
+                "ticker": actual_ticker,
+                "period": period_str,
+                "data": rows,
+                "data_points": len(rows)
+            }
         
         return {
             "results": results,
@@ -737,7 +1148,9 @@ async def get_historical_data_batch(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.post("/api/portfolio", response_model=PortfolioResponse)
+# No response_model: FastAPI would re-validate the multi-thousand-point
+# timeseries on every response (shape documented by PortfolioResponse above)
+@app.post("/api/portfolio")
 async def calculate_portfolio_performance(request: PortfolioRequest):
     """
     Calculate portfolio performance from a list of tickers and weights.
@@ -750,7 +1163,8 @@ async def calculate_portfolio_performance(request: PortfolioRequest):
     
     Returns:
     - performance: Cumulative return (%), annualized volatility (%), maximum drawdown (%)
-    - timeseries: Time series of portfolio value over time (normalized to start at 1.0)
+    - timeseries: Parallel dates/values arrays of portfolio value over time
+      (normalized to start at 1.0)
     """
     try:
         # Validation is handled by Pydantic validators
@@ -761,47 +1175,45 @@ async def calculate_portfolio_performance(request: PortfolioRequest):
         # Get current FX rate for currency conversion
         target_currency = request.currency
         
-        # Fetch historical data for all tickers
+        # Fetch historical data for all tickers in one batched yfinance download
+        # (one HTTP request instead of N), then look up currencies concurrently
+        batch = await download_history_batch_cached(request.tickers, request.period)
+
+        actual_tickers = {t: batch[normalize_ticker_for_data(t)][1]
+                          for t in request.tickers
+                          if normalize_ticker_for_data(t) in batch}
+        currency_results = await asyncio.gather(
+            *[get_stock_currency(at) for at in actual_tickers.values()],
+            return_exceptions=True
+        )
+        currencies = {at: (c if not isinstance(c, Exception) else "USD")
+                      for at, c in zip(actual_tickers.values(), currency_results)}
+
         portfolio_data = {}
         ticker_to_actual_ticker = {}  # Map original ticker to actual ticker used
         ticker_currencies = {}  # Track each ticker's native currency
         failed_tickers = []
-        
-        for i, ticker in enumerate(request.tickers):
-            try:
-                hist, actual_ticker = await fetch_historical_data(ticker, request.period)
-                if not hist.empty:
-                    # Get stock info to determine native currency
-                    stock = yf.Ticker(actual_ticker)
-                    info = stock.info
-                    stock_currency = info.get("currency", "USD")
-                    ticker_currencies[actual_ticker] = stock_currency
-                    
-                    # Use Adjusted Close if available, otherwise use Close
-                    if 'Adj Close' in hist.columns:
-                        prices = hist['Adj Close'].copy()
-                    else:
-                        prices = hist['Close'].copy()
-                    
-                    # Convert prices to target currency if needed
-                    if stock_currency != target_currency:
-                        # Convert using historical FX rates for accuracy
-                        # Since prices are normalized later, we can use a single conversion rate
-                        # Using the rate from the first trading date for consistency
-                        first_date = prices.index[0] if isinstance(prices.index, pd.DatetimeIndex) else None
-                        if stock_currency == "USD" and target_currency == "CAD":
-                            fx_rate = await get_fx_rate("USD", "CAD", first_date)
-                            prices = prices * fx_rate
-                        elif stock_currency == "CAD" and target_currency == "USD":
-                            fx_rate = await get_fx_rate("CAD", "USD", first_date)
-                            prices = prices * fx_rate
-                    
-                    portfolio_data[actual_ticker] = prices
-                    ticker_to_actual_ticker[ticker] = actual_ticker
-                else:
-                    failed_tickers.append(ticker)
-            except Exception as e:
-                failed_tickers.append(f"{ticker}: {str(e)}")
+
+        for ticker in request.tickers:
+            if ticker not in actual_tickers:
+                failed_tickers.append(ticker)
+                continue
+            actual_ticker = actual_tickers[ticker]
+            hist = batch[normalize_ticker_for_data(ticker)][0]
+            stock_currency = currencies[actual_ticker]
+
+            ticker_currencies[actual_ticker] = stock_currency
+
+            # Use Adjusted Close if available, otherwise use Close (no copy:
+            # downstream only reads, and FX conversion happens column-wise
+            # after alignment)
+            if 'Adj Close' in hist.columns:
+                prices = hist['Adj Close']
+            else:
+                prices = hist['Close']
+
+            portfolio_data[actual_ticker] = prices
+            ticker_to_actual_ticker[ticker] = actual_ticker
         
         if not portfolio_data:
             raise HTTPException(
@@ -809,100 +1221,90 @@ async def calculate_portfolio_performance(request: PortfolioRequest):
                 detail=f"No data available for any ticker. Failed tickers: {', '.join(failed_tickers)}"
             )
         
-        # Filter out failed tickers and adjust weights
-        successful_tickers = [t for t in request.tickers if t in ticker_to_actual_ticker]
-        successful_weights = [normalized_weights[i] for i, t in enumerate(request.tickers) if t in ticker_to_actual_ticker]
-        
-        if not successful_tickers:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Unable to fetch data for any ticker. Failed: {', '.join(failed_tickers)}"
-            )
-        
-        # Recalculate weights for successful tickers (normalize to sum to 1.0)
-        successful_weights_sum = sum(successful_weights)
-        if successful_weights_sum > 0:
-            successful_weights = [w / successful_weights_sum for w in successful_weights]
-        
         # Combine into portfolio DataFrame, aligning dates
         df = pd.DataFrame(portfolio_data)
         
         # Forward fill and backward fill to handle missing dates
-        df = df.ffill().bfill()
+        df = _pad_fill(df)
         
         if df.empty:
             raise HTTPException(status_code=404, detail="No overlapping trading dates found")
-        
-        # Normalize each stock to start at value = 1.0
-        df_normalized = df / df.iloc[0]
-        
-        # Create weight mapping: map actual ticker (dataframe column) to weight
-        weight_map = {}
-        for ticker, weight in zip(successful_tickers, successful_weights):
-            actual_ticker = ticker_to_actual_ticker[ticker]
-            if actual_ticker in df_normalized.columns:
-                weight_map[actual_ticker] = weight
-        
-        # Verify all weights are assigned
-        total_assigned_weight = sum(weight_map.values())
-        if abs(total_assigned_weight - 1.0) > 0.01:
-            # If weights don't match, redistribute equally (shouldn't happen, but safety check)
-            if weight_map:
-                equal_weight = 1.0 / len(weight_map)
-                weight_map = {ticker: equal_weight for ticker in weight_map.keys()}
-            else:
-                # Fallback: equal weights for all available stocks
-                equal_weight = 1.0 / len(df_normalized.columns)
-                weight_map = {ticker: equal_weight for ticker in df_normalized.columns}
-        
-        # Calculate weighted portfolio value over time
-        portfolio_values = pd.Series(0.0, index=df_normalized.index)
-        
-        for ticker, price_series in df_normalized.items():
-            weight = weight_map.get(ticker, 0.0)
-            portfolio_values += price_series * weight
-        
-        # Calculate daily returns
-        returns = portfolio_values.pct_change().dropna()
-        
-        # Calculate cumulative return (%)
-        cumulative_return = ((portfolio_values.iloc[-1] / portfolio_values.iloc[0]) - 1) * 100
-        
-        # Calculate annualized volatility (%)
-        # Using 252 trading days per year
-        annualized_volatility = returns.std() * np.sqrt(252) * 100
-        
-        # Calculate maximum drawdown (%)
-        running_max = portfolio_values.cummax()
-        drawdown = (portfolio_values - running_max) / running_max
-        max_drawdown = drawdown.min() * 100
-        
-        # Prepare time series
-        timeseries = [
-            PortfolioTimeSeriesPoint(
-                date=date.strftime("%Y-%m-%d"),
-                value=float(value)
-            )
-            for date, value in portfolio_values.items()
-        ]
-        
-        # Create response
-        performance = PortfolioPerformance(
-            return_=round(cumulative_return, 2),
-            volatility=round(annualized_volatility, 2),
-            drawdown=round(max_drawdown, 2)
-        )
-        
-        response = PortfolioResponse(
-            performance=performance,
-            timeseries=timeseries
-        )
-        
-        # Add currency info to response (using Pydantic's model_dump and adding custom field)
-        response_dict = response.model_dump()
-        response_dict["currency"] = target_currency
-        
-        return response_dict
+
+        # Convert to target currency with one anchor date and one FX lookup per
+        # distinct currency pair, applied as a vectorized column-wise scale,
+        # instead of an index access + FX branch inside the per-ticker loop
+        first_date = df.index[0] if isinstance(df.index, pd.DatetimeIndex) else None
+        needed_pairs = {(ticker_currencies[c], target_currency) for c in df.columns
+                        if ticker_currencies[c] != target_currency
+                        and ticker_currencies[c] in ["USD", "CAD"]}
+        pair_rates = dict(zip(
+            needed_pairs,
+            await asyncio.gather(*[get_fx_rate(a, b, first_date) for a, b in needed_pairs])
+        ))
+        for (stock_currency, _), fx_rate in pair_rates.items():
+            if fx_rate is None:
+                continue
+            fx_cols = [c for c in df.columns if ticker_currencies[c] == stock_currency]
+            df.loc[:, fx_cols] = df.loc[:, fx_cols] * fx_rate
+
+        # From here the pipeline stays in numpy arrays; the DataFrame only
+        # contributes its index and column order. Normalized matrix is float32
+        # (see calculate_portfolio - halves memory traffic per pass).
+        index = df.index
+        columns = list(df.columns)
+        prices = df.to_numpy(dtype=np.float64, copy=False)
+        norm = (prices / prices[0]).astype(np.float32)
+
+        # Build the weight vector index-aligned to the matrix column order in a
+        # single pass - renormalizing over the tickers that actually resolved -
+        # instead of the successful-ticker list and weight_map dict rebuilds
+        col_index = {c: i for i, c in enumerate(columns)}
+        w = np.zeros(len(columns), dtype=np.float32)
+        for i, ticker in enumerate(request.tickers):
+            actual_ticker = ticker_to_actual_ticker.get(ticker)
+            if actual_ticker in col_index:
+                w[col_index[actual_ticker]] = normalized_weights[i]
+        w_sum = float(w.sum())
+        if w_sum > 0:
+            w /= w_sum
+        else:
+            # Fallback: equal weights for all available stocks (shouldn't
+            # happen, but safety check)
+            w[:] = 1.0 / len(columns)
+
+        # Weighted portfolio value over time as a single matrix-vector product,
+        # promoted back to float64 where it leaves the hot path
+        pv = (norm @ w).astype(np.float64)
+
+        # Cumulative return, annualized volatility and max drawdown (all in %)
+        # from the fused kernel instead of three separate walks over pv,
+        # rounded once as a batch rather than per field
+        cumulative_return, annualized_volatility, max_drawdown = \
+            np.round(_portfolio_stats(pv), 2).tolist()
+
+        # Prepare time series in columnar form (two parallel arrays): halves
+        # the JSON bytes vs per-row {date, value} objects and builds in two
+        # batched calls. values stays a numpy array: ORJSONResponse serializes
+        # it natively (OPT_SERIALIZE_NUMPY), skipping per-element conversion
+        timeseries = {
+            "dates": index.strftime("%Y-%m-%d").tolist(),
+            "values": pv
+        }
+
+        # Build the response dict directly (shape documented by
+        # PortfolioResponse above) - instantiating the model only to
+        # model_dump it again would re-walk the whole payload. Returning a
+        # concrete response hands it straight to orjson instead of routing
+        # it through jsonable_encoder first
+        return ORJSONResponse({
+            "performance": {
+                "return": cumulative_return,
+                "volatility": annualized_volatility,
+                "drawdown": max_drawdown
+            },
+            "timeseries": timeseries,
+            "currency": target_currency
+        })
     
     except HTTPException:
         raise
@@ -917,12 +1319,34 @@ async def calculate_portfolio_performance(request: PortfolioRequest):
 def analyze_stock_fundamentals(ticker: str) -> dict:
     """Fetch and analyze stock fundamentals and historical performance"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        
-        # Get historical data
-        hist_5y = stock.history(period="5y")
-        hist_1y = stock.history(period="1y")
+        info = get_info_cached_sync(ticker)
+
+        # Price-level fields come from fast_info (a small price-summary fetch,
+        # same as the currency lookup) rather than the full .info blob; the
+        # full info is only relied on for the fundamental ratios below
+        fast_fields = {}
+        try:
+            fast = yf.Ticker(ticker).fast_info
+            fast_fields = {
+                "current_price": fast["lastPrice"],
+                "market_cap": fast["marketCap"],
+                "52_week_high": fast["yearHigh"],
+                "52_week_low": fast["yearLow"],
+            }
+        except Exception:
+            pass
+
+        # Get historical data (cached; back-to-back dashboard calls reuse it)
+        try:
+            hist_5y = get_history_cached_sync(ticker, "5y")[0]
+        except Exception:
+            hist_5y = pd.DataFrame()
+
+        # The last year is a slice of the 5y frame - no second download
+        if not hist_5y.empty:
+            hist_1y = hist_5y.loc[hist_5y.index >= hist_5y.index[-1] - pd.Timedelta(days=365)]
+        else:
+            hist_1y = pd.DataFrame()
         
         # Calculate key metrics
         metrics = {
@@ -930,13 +1354,14 @@ def analyze_stock_fundamentals(ticker: str) -> dict:
             "company_name": info.get("longName", info.get("shortName", ticker)),
             "sector": info.get("sector", "Unknown"),
             "industry": info.get("industry", "Unknown"),
-            "market_cap": info.get("marketCap", 0),
-            "current_price": info.get("currentPrice", info.get("regularMarketPrice", 0)),
+            "market_cap": fast_fields.get("market_cap") or info.get("marketCap", 0),
+            "current_price": fast_fields.get("current_price")
+                or info.get("currentPrice", info.get("regularMarketPrice", 0)),
             "pe_ratio": info.get("trailingPE", info.get("forwardPE", None)),
             "pb_ratio": info.get("priceToBook", None),
             "dividend_yield": info.get("dividendYield") or 0,
-            "52_week_high": info.get("fiftyTwoWeekHigh", 0),
-            "52_week_low": info.get("fiftyTwoWeekLow", 0),
+            "52_week_high": fast_fields.get("52_week_high") or info.get("fiftyTwoWeekHigh", 0),
+            "52_week_low": fast_fields.get("52_week_low") or info.get("fiftyTwoWeekLow", 0),
             "beta": info.get("beta", 1.0),
             "debt_to_equity": info.get("debtToEquity", None),
             "profit_margins": info.get("profitMargins", None),
@@ -949,14 +1374,14 @@ def analyze_stock_fundamentals(ticker: str) -> dict:
             prices_5y = hist_5y['Close'] if 'Close' in hist_5y.columns else hist_5y.iloc[:, 0]
             returns_5y = prices_5y.pct_change().dropna()
             metrics["5y_total_return"] = ((prices_5y.iloc[-1] / prices_5y.iloc[0]) - 1) * 100
-            metrics["5y_volatility"] = returns_5y.std() * np.sqrt(252) * 100
-            metrics["5y_max_drawdown"] = ((prices_5y / prices_5y.cummax()) - 1).min() * 100
+            metrics["5y_volatility"] = returns_5y.std() * _ANNUALIZE_PCT
+            metrics["5y_max_drawdown"] = _max_drawdown_pct(prices_5y.to_numpy(dtype=np.float64, copy=False))
         
         if not hist_1y.empty:
             prices_1y = hist_1y['Close'] if 'Close' in hist_1y.columns else hist_1y.iloc[:, 0]
             returns_1y = prices_1y.pct_change().dropna()
             metrics["1y_total_return"] = ((prices_1y.iloc[-1] / prices_1y.iloc[0]) - 1) * 100
-            metrics["1y_volatility"] = returns_1y.std() * np.sqrt(252) * 100
+            metrics["1y_volatility"] = returns_1y.std() * _ANNUALIZE_PCT
         
         # Price position relative to 52-week range
         if metrics["52_week_high"] > 0 and metrics["52_week_low"] > 0:
@@ -1034,7 +1459,7 @@ Please provide:
 Be specific and reference the actual numbers in your analysis.
 """
 
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are a financial analyst providing clear, concise investment recommendations. Always base your analysis on the provided data and highlight specific metrics."},
@@ -1126,58 +1551,81 @@ async def get_stock_recommendations(request: StockRecommendationRequest):
         if len(request.tickers) > 10:
             raise HTTPException(status_code=400, detail="Maximum 10 tickers allowed per request")
         
-        recommendations = []
-        
-        for ticker in request.tickers:
+        # Analyze all tickers concurrently: fundamentals run in worker threads
+        # (blocking yfinance IO) and the LLM calls overlap, instead of paying
+        # the full analyze-then-recommend latency once per ticker in series
+        async def _analyze_one(
+            ticker: str
+        ) -> Union[StockRecommendation, Tuple[str, str, dict]]:
             try:
                 # Normalize ticker
                 normalized_ticker = normalize_ticker_for_data(ticker)
-                
-                # Analyze fundamentals
-                metrics = analyze_stock_fundamentals(normalized_ticker)
-                
+
+                # Analyze fundamentals (bounded so one hung fetch can't stall the batch)
+                metrics = await asyncio.wait_for(
+                    asyncio.to_thread(analyze_stock_fundamentals, normalized_ticker),
+                    timeout=30
+                )
+
                 if "error" in metrics:
-                    recommendations.append(StockRecommendation(
+                    return StockRecommendation(
                         ticker=normalized_ticker,
                         recommendation=f"Unable to analyze {normalized_ticker}: {metrics.get('error', 'Unknown error')}",
                         key_points=[]
-                    ))
-                    continue
-                
-                # Generate recommendation
+                    )
+
+                # Generate recommendation; confidence and key points are
+                # derived in one vectorized pass after the gather below
                 recommendation_text = await generate_ai_recommendation(normalized_ticker, metrics)
-                
-                # Extract key points
-                key_points = []
-                if metrics.get("pe_ratio"):
-                    key_points.append(f"P/E Ratio: {metrics['pe_ratio']:.2f}")
-                if metrics.get("5y_total_return") is not None:
-                    key_points.append(f"5Y Return: {metrics['5y_total_return']:.2f}%")
-                if metrics.get("1y_total_return") is not None:
-                    key_points.append(f"1Y Return: {metrics['1y_total_return']:.2f}%")
-                if metrics.get("price_position") is not None:
-                    key_points.append(f"Price Position: {metrics['price_position']:.1f}% of 52W range")
-                
-                # Determine confidence level
-                confidence = "Medium"
-                if metrics.get("pe_ratio") and metrics.get("5y_total_return") is not None:
-                    if 15 < metrics["pe_ratio"] < 25 and metrics["5y_total_return"] > 50:
-                        confidence = "High"
-                    elif metrics["pe_ratio"] > 40 or metrics["5y_total_return"] < -20:
-                        confidence = "Low"
-                
-                recommendations.append(StockRecommendation(
-                    ticker=normalized_ticker,
-                    recommendation=recommendation_text,
-                    confidence=confidence,
-                    key_points=key_points
-                ))
+
+                return (normalized_ticker, recommendation_text, metrics)
             except Exception as e:
-                recommendations.append(StockRecommendation(
+                return StockRecommendation(
                     ticker=ticker,
                     recommendation=f"Error analyzing {ticker}: {str(e)}",
                     key_points=[]
-                ))
+                )
+
+        results = await asyncio.gather(*[_analyze_one(t) for t in request.tickers])
+
+        # Collate metrics across tickers and compute confidence with boolean
+        # masks (NaN marks a missing metric and compares False, leaving the
+        # Medium default) instead of per-ticker threshold branches
+        recommendations = [r if isinstance(r, StockRecommendation) else None
+                           for r in results]
+        analyzed = [(i, r) for i, r in enumerate(results)
+                    if not isinstance(r, StockRecommendation)]
+        if analyzed:
+            metrics_list = [m for _, (_, _, m) in analyzed]
+            pes = np.array([m.get("pe_ratio") or np.nan for m in metrics_list],
+                           dtype=np.float64)
+            r5 = np.array([np.nan if m.get("5y_total_return") is None
+                           else m["5y_total_return"] for m in metrics_list])
+            r1 = np.array([np.nan if m.get("1y_total_return") is None
+                           else m["1y_total_return"] for m in metrics_list])
+            pos = np.array([np.nan if m.get("price_position") is None
+                            else m["price_position"] for m in metrics_list])
+            high = (pes > 15) & (pes < 25) & (r5 > 50)
+            low = ~np.isnan(pes) & ~np.isnan(r5) & ((pes > 40) | (r5 < -20))
+            confidences = np.select([high, low], ["High", "Low"], default="Medium")
+
+            for (idx, (ticker, text, _)), conf, pe, five, one, ppos in zip(
+                    analyzed, confidences, pes, r5, r1, pos):
+                key_points = []
+                if not np.isnan(pe):
+                    key_points.append(f"P/E Ratio: {pe:.2f}")
+                if not np.isnan(five):
+                    key_points.append(f"5Y Return: {five:.2f}%")
+                if not np.isnan(one):
+                    key_points.append(f"1Y Return: {one:.2f}%")
+                if not np.isnan(ppos):
+                    key_points.append(f"Price Position: {ppos:.1f}% of 52W range")
+                recommendations[idx] = StockRecommendation(
+                    ticker=ticker,
+                    recommendation=text,
+                    confidence=str(conf),
+                    key_points=key_points
+                )
         
         # Generate summary if multiple stocks
         summary = None
@@ -1188,7 +1636,7 @@ Summarize the following stock recommendations in 2-3 sentences, highlighting the
 
 {chr(10).join([f"{r.ticker}: {r.recommendation[:200]}..." for r in recommendations])}
 """
-                response = openai_client.chat.completions.create(
+                response = await openai_client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[
                         {"role": "system", "content": "You are a financial analyst providing concise portfolio summaries."},
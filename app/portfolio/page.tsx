@@ -16,10 +16,10 @@ export interface PortfolioData {
     volatility: number;
     drawdown: number;
   };
-  timeseries: Array<{
-    date: string;
-    value: number;
-  }>;
+  timeseries: {
+    dates: string[];
+    values: number[];
+  };
   currency?: string;
 }
 
@@ -37,10 +37,10 @@ export default function FiveYearComparison({
     const dateMap = new Map<string, any>();
 
     // Add portfolio data first (this is our primary data source)
-    portfolioData5y.timeseries.forEach((point) => {
-      dateMap.set(point.date, {
-        date: point.date,
-        portfolio: point.value,
+    portfolioData5y.timeseries.dates.forEach((date, i) => {
+      dateMap.set(date, {
+        date,
+        portfolio: portfolioData5y.timeseries.values[i],
       });
     });
 
@@ -117,7 +117,7 @@ export default function FiveYearComparison({
 
   // Calculate final values
   const portfolioFinalValue =
-    portfolioData5y.timeseries[portfolioData5y.timeseries.length - 1]?.value ||
+    portfolioData5y.timeseries.values[portfolioData5y.timeseries.values.length - 1] ||
     1;
   const portfolioReturn = portfolioData5y.performance.return;
 
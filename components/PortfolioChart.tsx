@@ -31,10 +31,10 @@ export default function PortfolioChart({
     const dateMap = new Map<string, any>();
 
     // Add portfolio data first (this is our primary data source)
-    portfolioData.timeseries.forEach((point) => {
-      dateMap.set(point.date, {
-        date: point.date,
-        portfolio: point.value,
+    portfolioData.timeseries.dates.forEach((date, i) => {
+      dateMap.set(date, {
+        date,
+        portfolio: portfolioData.timeseries.values[i],
       });
     });
 